@@ -1622,6 +1622,7 @@ export class BeamSidebar extends LitElement {
         class="photon-item ${isSelected ? 'active' : ''} ${photon.internal
           ? 'internal'
           : ''} ${this._isPhotonWarm(photon.name) ? 'warmth' : ''}"
+        data-testid="photon-${photon.name}"
         role="option"
         aria-selected="${isSelected}"
         tabindex="0"
@@ -1677,6 +1678,7 @@ export class BeamSidebar extends LitElement {
     return html`
       <li
         class="photon-item ${isSelected ? 'active' : ''} ${!isConnected ? 'disconnected' : ''}"
+        data-testid="photon-${mcp.name}"
         role="option"
         aria-selected="${isSelected}"
         tabindex="0"
@@ -558,6 +558,7 @@ export class MethodCard extends LitElement {
         class="card glass-panel motion-scale-in ${isTyped ? 'typed' : ''}"
         data-enter="scale-in"
         style="${isTyped ? `--type-accent: ${typeAccent}` : ''}"
+        data-testid="method-${this.method.name}"
         role="button"
         tabindex="0"
         aria-label="${this.method.title || this.method.name}${hasDescription
@@ -0,0 +1,198 @@
+"""Shared helpers for the BEAM Python scripts.
+
+Tests get a page from the conftest.py fixtures; standalone scripts use
+beam_page(). Both go through the same browser/context setup here.
+"""
+import os
+import re
+from contextlib import contextmanager
+
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+from playwright.sync_api import sync_playwright
+
+BEAM_URL = "http://localhost:3000"
+SCREENSHOTS_DIR = "/tmp/beam-visual-tests"
+# Kept apart from SCREENSHOTS_DIR, which runs including visual-test.py wipe
+TRACES_DIR = "/tmp/beam-traces"
+VIEWPORT = {"width": 1400, "height": 900}
+# Main panel, right of the default 300px sidebar
+RESULT_CLIP = {"x": 300, "y": 0, "width": 1100, "height": 900}
+
+# Tool calls go over /mcp; /rpc is kept for older BEAM builds
+RPC_URL = re.compile(r"/(mcp|rpc)\b")
+# The loading skeleton is also a .content, and tool responses arrive before
+# it is replaced; callers pass a format-specific selector (".kv-table",
+# ".smart-chips", ...) when the rendered shape matters
+RESULT_CONTENT = "result-viewer .content:not(:has(.skeleton-list))"
+
+# Resources the DOM and console checks never look at
+BLOCKED_ASSETS = "**/*.{png,jpg,jpeg,gif,svg,woff,woff2,ttf}"
+BLOCKED_TRACKERS = "**/{analytics,gtag,segment}*"
+BLOCKED_STYLES = "**/*.css"
+
+# Skip machinery headless runs never use; /dev/shm is tiny in containers
+CHROMIUM_ARGS = [
+    "--disable-dev-shm-usage",
+    "--no-sandbox",
+    "--disable-gpu",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-background-timer-throttling",
+    "--disable-renderer-backgrounding",
+    "--disable-features=TranslateUI,BlinkGenPropertyTrees",
+]
+
+# Counts matches per selector under root (default: the whole document),
+# descending into open shadow roots the way Playwright locators do
+COUNT_SELECTORS_JS = """(selectors, root) => {
+    const counts = Object.fromEntries(selectors.map((s) => [s, 0]));
+    const visit = (root) => {
+        for (const s of selectors) counts[s] += root.querySelectorAll(s).length;
+        for (const el of root.querySelectorAll('*')) {
+            if (el.shadowRoot) visit(el.shadowRoot);
+        }
+    };
+    visit(root ? root.shadowRoot || root : document);
+    return counts;
+}"""
+
+def launch_browser(p):
+    return p.chromium.launch(
+        headless=os.environ.get("HEADLESS") != "false", args=CHROMIUM_ARGS
+    )
+
+def new_context(browser):
+    return browser.new_context(viewport=VIEWPORT)
+
+@contextmanager
+def beam_page():
+    """Launch a browser and yield a fresh page, for running outside pytest."""
+    with sync_playwright() as p:
+        browser = launch_browser(p)
+        context = new_context(browser)
+        try:
+            yield context.new_page()
+        finally:
+            context.close()
+            browser.close()
+
+def save_screenshot(page, name, result=False):
+    """Save a screenshot under SCREENSHOTS_DIR and return its file name.
+
+    Result screenshots only need the main panel, so they are clipped and
+    saved as JPEG. Everything else is a full-viewport PNG with animations
+    frozen.
+    """
+    if result:
+        filename = f"{name}.jpg"
+        page.screenshot(
+            path=f"{SCREENSHOTS_DIR}/{filename}", type="jpeg", quality=60, clip=RESULT_CLIP
+        )
+    else:
+        filename = f"{name}.png"
+        page.screenshot(
+            path=f"{SCREENSHOTS_DIR}/{filename}", omit_background=True, animations="disabled"
+        )
+    return filename
+
+def count_selectors(page, *selectors):
+    """Count matches for several selectors in a single round-trip."""
+    return page.evaluate(COUNT_SELECTORS_JS, list(selectors))
+
+def wait_for_match(page, selector, root, timeout=5000):
+    """Wait until selector matches inside the first element matching root.
+
+    Scoping to a component keeps each poll to that component's subtree
+    rather than every shadow root in the page.
+    """
+    container = page.locator(root).first.element_handle(timeout=timeout)
+    page.wait_for_function(
+        f"([selector, root]) => ({COUNT_SELECTORS_JS})([selector], root)[selector] > 0",
+        arg=[selector, container],
+        polling=100,
+        timeout=timeout,
+    )
+
+def capture_console(page, pattern=None):
+    """Collect "[type] text" console lines, optionally only those matching pattern.
+
+    Filtering happens in the handler, so noisy messages are never formatted
+    or stored.
+    """
+    messages = []
+
+    def on_console(msg):
+        text = msg.text
+        if pattern is None or pattern.search(text):
+            messages.append(f"[{msg.type}] {text}")
+
+    page.on("console", on_console)
+    return messages
+
+def block_resources(page, styles=False):
+    """Abort image, font and tracker requests before the page loads.
+
+    Pass styles=True for checks that only assert on DOM presence. Don't use
+    this in scripts whose screenshots are the point.
+    """
+    patterns = [BLOCKED_ASSETS, BLOCKED_TRACKERS]
+    if styles:
+        patterns.append(BLOCKED_STYLES)
+    for pattern in patterns:
+        page.route(pattern, lambda route: route.abort())
+
+def wait_for_photon(page, name, attempts=3, timeout=2000):
+    """Wait for a photon to appear in the sidebar, reloading between attempts.
+
+    Fails in ~attempts * timeout ms instead of blocking on one long wait
+    when the dev server is down.
+    """
+    item = page.get_by_test_id(f"photon-{name}")
+    for attempt in range(attempts):
+        try:
+            item.wait_for(timeout=timeout)
+            return
+        except PlaywrightTimeoutError:
+            if attempt == attempts - 1:
+                raise
+            page.reload(wait_until="domcontentloaded")
+
+def open_beam(page, photon, url=BEAM_URL):
+    """Load BEAM and wait until the given photon is listed."""
+    page.goto(url, wait_until="domcontentloaded")
+    wait_for_photon(page, photon)
+
+def is_tool_call(response):
+    """Match the response to a tool invocation, not other MCP traffic."""
+    request = response.request
+    return (
+        request.method == "POST"
+        and RPC_URL.search(response.url) is not None
+        and "tools/call" in (request.post_data or "")
+    )
+
+def click_and_wait_for_result(page, target, ready, timeout=5000):
+    """Click something that invokes a tool and wait for its rendered result.
+
+    Unblocks as soon as the tool call's response arrives instead of after a
+    fixed delay, then waits for ready, a selector for the rendered result.
+    """
+    with page.expect_response(is_tool_call, timeout=timeout) as response_info:
+        target.click()
+    response = response_info.value
+    assert response.ok, f"Tool call failed: HTTP {response.status}"
+    page.wait_for_selector(ready, timeout=timeout)
+
+def click_photon_method(page, photon, method, auto_run=False, ready=RESULT_CONTENT):
+    """Expand a photon in the sidebar and select one of its methods.
+
+    Methods without parameters run as soon as they are selected; pass
+    auto_run=True to wait for that call's response and for ready to match.
+    """
+    page.get_by_test_id(f"photon-{photon}").click()
+    method_card = page.get_by_test_id(f"method-{method}")
+    method_card.wait_for(timeout=5000)
+    if auto_run:
+        click_and_wait_for_result(page, method_card, ready)
+    else:
+        method_card.click()
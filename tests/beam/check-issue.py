@@ -1,42 +1,32 @@
 """Check current state of BEAM UI"""
-from playwright.sync_api import sync_playwright
-import time
+import sys
 
-def test():
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page(viewport={"width": 1400, "height": 900})
+import pytest
 
-        console_msgs = []
-        page.on("console", lambda msg: console_msgs.append(f"[{msg.type}] {msg.text}"))
+from _harness import (
+    block_resources,
+    capture_console,
+    click_photon_method,
+    open_beam,
+    save_screenshot,
+)
 
-        print("Loading BEAM...")
-        page.goto("http://localhost:3000")
-        page.wait_for_load_state("networkidle")
+def test(page):
+    console_msgs = capture_console(page)
+    block_resources(page, styles=True)
 
-        try:
-            page.wait_for_selector("text=demo", timeout=15000)
-        except:
-            print("Timeout - photons not loaded")
-            return
+    print("Loading BEAM...")
+    open_beam(page, "demo")
 
-        time.sleep(1)
+    print("Clicking demo > getObject...")
+    click_photon_method(page, "demo", "getObject", auto_run=True, ready=".json-key")
 
-        print("Clicking demo...")
-        page.locator("text=demo").first.click()
-        time.sleep(0.5)
+    print("\nConsole output:")
+    for msg in console_msgs:
+        print(msg)
 
-        print("Clicking getObject...")
-        page.locator("text=getObject").first.click()
-        time.sleep(2)
-
-        print("\nConsole output:")
-        for msg in console_msgs:
-            print(msg)
-
-        page.screenshot(path="/tmp/beam-visual-tests/current-state.png")
-        print("\nScreenshot: current-state.png")
-        browser.close()
+    filename = save_screenshot(page, "current-state", result=True)
+    print(f"\nScreenshot: {filename}")
 
 if __name__ == "__main__":
-    test()
+    sys.exit(pytest.main([__file__, "-s"]))
@@ -0,0 +1,43 @@
+"""Shared Playwright fixtures for the BEAM Python scripts.
+
+One Chromium process is launched per session (per worker under
+pytest-xdist); each test gets its own cheap, isolated context.
+"""
+import os
+import shutil
+
+import pytest
+from playwright.sync_api import sync_playwright
+
+from _harness import SCREENSHOTS_DIR, launch_browser, new_context
+
+def runs_visual_test(config):
+    """True when the run includes visual-test.py: the whole directory or the script."""
+    for arg in config.args or ["."]:
+        path = os.path.join(config.invocation_params.dir, arg.split("::")[0])
+        if os.path.isdir(path) or os.path.basename(path) == "visual-test.py":
+            return True
+    return False
+
+def pytest_sessionstart(session):
+    # visual-test.py reports every file in SCREENSHOTS_DIR, so start it from
+    # an empty directory. Single-script runs keep the other scripts' output.
+    # Only the xdist controller (or a plain run) clears it; workers share
+    # the directory and would race
+    if not hasattr(session.config, "workerinput") and runs_visual_test(session.config):
+        shutil.rmtree(SCREENSHOTS_DIR, ignore_errors=True)
+    os.makedirs(SCREENSHOTS_DIR, exist_ok=True)
+
+@pytest.fixture(scope="session")
+def browser():
+    with sync_playwright() as p:
+        browser = launch_browser(p)
+        yield browser
+        browser.close()
+
+@pytest.fixture
+def page(browser):
+    context = new_context(browser)
+    page = context.new_page()
+    yield page
+    context.close()
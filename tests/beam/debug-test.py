@@ -1,56 +1,46 @@
 """Debug test to capture browser console output"""
-from playwright.sync_api import sync_playwright
-import time
-
-def test_debug():
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page(viewport={"width": 1400, "height": 900})
-
-        # Capture console messages
-        console_messages = []
-        page.on("console", lambda msg: console_messages.append(f"[{msg.type}] {msg.text}"))
-
-        print("Loading BEAM UI...")
-        page.goto("http://localhost:3000")
-        page.wait_for_load_state("networkidle")
-
-        # Wait for photons to load
-        print("Waiting for photons...")
-        try:
-            page.wait_for_selector("text=demo", timeout=15000)
-        except:
-            print("Timeout waiting for demo photon")
-            print("\nConsole messages so far:")
-            for msg in console_messages:
-                print(f"  {msg}")
-            browser.close()
-            return
-
-        time.sleep(1)
-
-        # Click demo
-        print("Clicking demo...")
-        page.locator("text=demo").first.click()
-        time.sleep(0.5)
-
-        # Click getObject
-        print("Clicking getObject...")
-        page.locator("text=getObject").first.click()
-        time.sleep(2)
-
-        # Print all console messages
-        print("\n" + "="*60)
-        print("BROWSER CONSOLE OUTPUT:")
-        print("="*60)
+import sys
+
+import pytest
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+from _harness import (
+    SCREENSHOTS_DIR,
+    block_resources,
+    capture_console,
+    click_photon_method,
+    open_beam,
+    save_screenshot,
+)
+
+def test_debug(page):
+    # Capture console messages
+    console_messages = capture_console(page)
+    block_resources(page)
+
+    print("Loading BEAM UI...")
+    try:
+        open_beam(page, "demo")
+    except PlaywrightTimeoutError:
+        print("Timeout waiting for demo photon")
+        print("\nConsole messages so far:")
         for msg in console_messages:
-            print(msg)
+            print(f"  {msg}")
+        raise
 
-        # Take screenshot
-        page.screenshot(path="/tmp/beam-visual-tests/debug-result.png")
-        print("\nScreenshot saved: /tmp/beam-visual-tests/debug-result.png")
+    print("Clicking demo > getObject...")
+    click_photon_method(page, "demo", "getObject", auto_run=True, ready=".json-key")
 
-        browser.close()
+    # Print all console messages
+    print("\n" + "="*60)
+    print("BROWSER CONSOLE OUTPUT:")
+    print("="*60)
+    for msg in console_messages:
+        print(msg)
+
+    # Take screenshot
+    filename = save_screenshot(page, "debug-result", result=True)
+    print(f"\nScreenshot saved: {SCREENSHOTS_DIR}/{filename}")
 
 if __name__ == "__main__":
-    test_debug()
+    sys.exit(pytest.main([__file__, "-s"]))
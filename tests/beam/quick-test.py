@@ -1,29 +1,32 @@
 """Quick debug test"""
-from playwright.sync_api import sync_playwright
-import time
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 
-with sync_playwright() as p:
-    browser = p.chromium.launch(headless=True)
-    page = browser.new_page(viewport={"width": 1400, "height": 900})
+from _harness import beam_page, block_resources, save_screenshot
 
+with beam_page() as page:
+    block_resources(page, styles=True)
     print("Loading BEAM UI...")
-    page.goto("http://localhost:4321")
-    page.wait_for_load_state("networkidle")
-    time.sleep(2)
+    page.goto("http://localhost:4321", wait_until="domcontentloaded")
+    try:
+        # Returns as soon as the sidebar renders; 2s was the old fixed settle
+        page.wait_for_selector(".sidebar-area", timeout=2000)
+    except PlaywrightTimeoutError:
+        pass  # Reported below
 
-    page.screenshot(path="/tmp/beam-visual-tests/debug-load.png")
-    print("Screenshot saved: debug-load.png")
+    filename = save_screenshot(page, "debug-load")
+    print(f"Screenshot saved: {filename}")
 
-    # Check what's in the page
-    print(f"Title: {page.title()}")
-    sidebar = page.locator(".sidebar")
-    if sidebar.is_visible():
+    # Check what's in the page in one round-trip; only the slice crosses CDP
+    info = page.evaluate("""() => ({
+        title: document.title,
+        text: document.body.innerText.slice(0, 500),
+    })""")
+    print(f"Title: {info['title']}")
+    # The sidebar lives in beam-app's shadow root, which locators pierce
+    if page.locator(".sidebar-area").first.is_visible():
         print("Sidebar is visible")
     else:
         print("Sidebar NOT visible")
 
-    # List all text content
-    all_text = page.locator("body").text_content()
-    print(f"Page text (first 500 chars): {all_text[:500] if all_text else 'empty'}")
-
-    browser.close()
+    # List the start of the text content
+    print(f"Page text (first 500 chars): {info['text'] or 'empty'}")
@@ -1,35 +1,20 @@
 """Test input field styling"""
-from playwright.sync_api import sync_playwright
-import time
+import sys
 
-def test():
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page(viewport={"width": 1400, "height": 900})
+import pytest
 
-        print("Loading BEAM...")
-        page.goto("http://localhost:3000")
-        page.wait_for_load_state("networkidle")
+from _harness import click_photon_method, open_beam, save_screenshot
 
-        try:
-            page.wait_for_selector("text=demo", timeout=15000)
-        except:
-            print("Timeout")
-            return
+def test(page):
+    print("Loading BEAM...")
+    open_beam(page, "demo")
 
-        time.sleep(1)
+    print("Clicking demo > echo (has input parameter)...")
+    click_photon_method(page, "demo", "echo")
+    page.wait_for_selector("invoke-form input", state="visible", timeout=5000)
 
-        print("Clicking demo...")
-        page.locator("text=demo").first.click()
-        time.sleep(0.5)
-
-        print("Clicking echo (has input parameter)...")
-        page.locator("text=echo").first.click()
-        time.sleep(1)
-
-        page.screenshot(path="/tmp/beam-visual-tests/input-field.png")
-        print("\nScreenshot: input-field.png")
-        browser.close()
+    filename = save_screenshot(page, "input-field")
+    print(f"\nScreenshot: {filename}")
 
 if __name__ == "__main__":
-    test()
+    sys.exit(pytest.main([__file__, "-s"]))
@@ -1,35 +1,20 @@
 """Test JSON input for array parameters"""
-from playwright.sync_api import sync_playwright
-import time
+import sys
 
-def test():
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page(viewport={"width": 1400, "height": 900})
+import pytest
 
-        print("Loading BEAM...")
-        page.goto("http://localhost:3000")
-        page.wait_for_load_state("networkidle")
+from _harness import click_photon_method, open_beam, save_screenshot
 
-        try:
-            page.wait_for_selector("text=knowledge-graph", timeout=15000)
-        except:
-            print("Timeout - knowledge-graph not found")
-            return
+def test(page):
+    print("Loading BEAM...")
+    open_beam(page, "knowledge-graph")
 
-        time.sleep(1)
+    print("Clicking knowledge-graph > entities...")
+    click_photon_method(page, "knowledge-graph", "entities")
+    page.wait_for_selector("invoke-form textarea, invoke-form input", state="visible", timeout=5000)
 
-        print("Clicking knowledge-graph...")
-        page.locator("text=knowledge-graph").first.click()
-        time.sleep(0.5)
-
-        print("Clicking entities...")
-        page.locator("text=entities").first.click()
-        time.sleep(1)
-
-        page.screenshot(path="/tmp/beam-visual-tests/json-input.png")
-        print("\nScreenshot: json-input.png")
-        browser.close()
+    filename = save_screenshot(page, "json-input")
+    print(f"\nScreenshot: {filename}")
 
 if __name__ == "__main__":
-    test()
+    sys.exit(pytest.main([__file__, "-s"]))
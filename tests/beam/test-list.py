@@ -1,43 +1,35 @@
 """Test demo.getArray() list rendering"""
-from playwright.sync_api import sync_playwright
-import time
+import re
+import sys
 
-def test():
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page(viewport={"width": 1400, "height": 900})
+import pytest
 
-        console_msgs = []
-        page.on("console", lambda msg: console_msgs.append(f"[{msg.type}] {msg.text}"))
+from _harness import (
+    block_resources,
+    capture_console,
+    click_photon_method,
+    open_beam,
+    save_screenshot,
+)
 
-        print("Loading BEAM...")
-        page.goto("http://localhost:3000")
-        page.wait_for_load_state("networkidle")
+CONSOLE_FILTER = re.compile(r"renderSmartResult|format|layout", re.I)
 
-        try:
-            page.wait_for_selector("text=demo", timeout=15000)
-        except:
-            print("Timeout")
-            return
+def test(page):
+    console_msgs = capture_console(page, CONSOLE_FILTER)
+    block_resources(page, styles=True)
 
-        time.sleep(1)
+    print("Loading BEAM...")
+    open_beam(page, "demo")
 
-        print("Clicking demo...")
-        page.locator("text=demo").first.click()
-        time.sleep(0.5)
+    print("Clicking demo > getArray...")
+    click_photon_method(page, "demo", "getArray", auto_run=True, ready=".smart-chips")
 
-        print("Clicking getArray...")
-        page.locator("text=getArray").first.click()
-        time.sleep(2)
+    print("\nConsole output:")
+    for msg in console_msgs:
+        print(msg)
 
-        print("\nConsole output:")
-        for msg in console_msgs:
-            if "renderSmartResult" in msg or "format" in msg.lower() or "layout" in msg.lower():
-                print(msg)
-
-        page.screenshot(path="/tmp/beam-visual-tests/list-result.png")
-        print("\nScreenshot: list-result.png")
-        browser.close()
+    filename = save_screenshot(page, "list-result", result=True)
+    print(f"\nScreenshot: {filename}")
 
 if __name__ == "__main__":
-    test()
+    sys.exit(pytest.main([__file__, "-s"]))
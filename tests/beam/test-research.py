@@ -1,56 +1,46 @@
 """Test content-creator.research() rendering"""
-from playwright.sync_api import sync_playwright
-import time
-
-def test():
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page(viewport={"width": 1400, "height": 900})
-
-        console_msgs = []
-        page.on("console", lambda msg: console_msgs.append(f"[{msg.type}] {msg.text}"))
-
-        print("Loading BEAM...")
-        page.goto("http://localhost:3000")
-        page.wait_for_load_state("networkidle")
-
-        try:
-            page.wait_for_selector("text=content-creator", timeout=15000)
-        except:
-            print("Timeout - photons not loaded")
-            return
-
-        time.sleep(1)
-
-        print("Clicking content-creator...")
-        page.locator("text=content-creator").first.click()
-        time.sleep(0.5)
-
-        print("Clicking research...")
-        page.locator("text=research").first.click()
-        time.sleep(0.5)
-
-        # Fill in topic
-        topic_input = page.locator("input").first
-        if topic_input.is_visible():
-            topic_input.fill("AI testing")
-            time.sleep(0.3)
-
-        # Click run button
-        run_btn = page.locator("button:has-text('Research')").first
-        if run_btn.is_visible():
-            run_btn.click()
-            print("Executing research...")
-            time.sleep(5)  # Wait for execution
-
-        print("\nConsole output:")
-        for msg in console_msgs:
-            if "renderSmartResult" in msg or "format" in msg.lower():
-                print(msg)
-
-        page.screenshot(path="/tmp/beam-visual-tests/research-result.png")
-        print("\nScreenshot: research-result.png")
-        browser.close()
+import re
+import sys
+
+import pytest
+
+from _harness import (
+    RESULT_CONTENT,
+    block_resources,
+    capture_console,
+    click_and_wait_for_result,
+    click_photon_method,
+    open_beam,
+    save_screenshot,
+)
+
+CONSOLE_FILTER = re.compile(r"renderSmartResult|format", re.I)
+
+def test(page):
+    console_msgs = capture_console(page, CONSOLE_FILTER)
+    block_resources(page)
+
+    print("Loading BEAM...")
+    open_beam(page, "content-creator")
+
+    print("Clicking content-creator > research...")
+    click_photon_method(page, "content-creator", "research")
+    page.wait_for_selector("invoke-form input", state="visible", timeout=5000)
+
+    # Fill in topic
+    page.locator("invoke-form input").first.fill("AI testing", timeout=3000)
+
+    # Click run button
+    print("Executing research...")
+    run_btn = page.locator("button:has-text('Research')").first
+    click_and_wait_for_result(page, run_btn, RESULT_CONTENT, timeout=10000)
+
+    print("\nConsole output:")
+    for msg in console_msgs:
+        print(msg)
+
+    filename = save_screenshot(page, "research-result", result=True)
+    print(f"\nScreenshot: {filename}")
 
 if __name__ == "__main__":
-    test()
+    sys.exit(pytest.main([__file__, "-s"]))